@@ -12,12 +12,15 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import hashlib
 import logging
+import os
 from pathlib import Path
 
 import pandas as pd
 
-from anticipy import configure_logging, forecast, forecast_plot
+from anticipy import __version__, configure_logging, forecast, forecast_plot
 
 # Configuration
 DEFAULT_FORECAST_YEARS = 2.0
@@ -27,10 +30,176 @@ DEFAULT_COL_NAME_X = "x"
 DEFAULT_COL_NAME_DATE = "date"
 DEFAULT_COL_NAME_SOURCE = "source"
 DEFAULT_OUTPUT_FORMAT = "png"
+DEFAULT_DATA_FORMAT = "csv"
+DATA_FORMATS = ("csv", "parquet", "feather")
+DEFAULT_CACHE_DIR_NAME = ".anticipy_cache"
 
 logger = logging.getLogger(__name__)
 
 
+def _read_input_csv(
+    input_path: Path,
+    col_names: list[str],
+    col_name_date: str,
+) -> pd.DataFrame:
+    """
+    Read only the forecast input columns from a CSV file.
+
+    Uses the multithreaded pyarrow parser when available, falling back to the
+    default C parser otherwise.
+
+    Parameters
+    ----------
+    input_path:
+        Path to the input CSV file.
+    col_names:
+        Names of the columns used by the forecast; any others are skipped.
+    col_name_date:
+        Column name holding dates, parsed to datetime while reading.
+    """
+    header = pd.read_csv(input_path, nrows=0).columns
+    usecols = [c for c in header if c in col_names]
+    parse_dates = [col_name_date] if col_name_date in usecols else None
+    try:
+        return pd.read_csv(input_path, engine="pyarrow", usecols=usecols, parse_dates=parse_dates)
+    except ImportError:
+        logger.info("pyarrow not available, reading CSV with the default parser")
+        return pd.read_csv(input_path, usecols=usecols, parse_dates=parse_dates)
+
+
+def _stringify_object_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert object columns (e.g. fitted model instances) to strings.
+
+    Parameters
+    ----------
+    df:
+        DataFrame to convert.
+    """
+    col_names_obj = [c for c in df.columns if df[c].dtype == object]
+    return df.astype({c: str for c in col_names_obj})
+
+
+def _write_output_frame(df: pd.DataFrame, path: Path, data_format: str) -> Path:
+    """
+    Write a forecast output table and return the path written.
+
+    CSV files are written with :meth:`pandas.DataFrame.to_csv`, keeping the
+    established quoting, date, boolean and missing value formatting. Binary
+    formats replace the path suffix, and store object columns as strings.
+
+    Parameters
+    ----------
+    df:
+        Output table.
+    path:
+        Output path for CSV output.
+    data_format:
+        One of csv, parquet or feather.
+    """
+    if data_format == "parquet":
+        path = path.with_suffix(".parquet")
+        _stringify_object_columns(df).to_parquet(path, index=False)
+    elif data_format == "feather":
+        path = path.with_suffix(".feather")
+        _stringify_object_columns(df).reset_index(drop=True).to_feather(path)
+    else:
+        df.to_csv(path, index=False)
+    return path
+
+
+def _get_cache_key(input_path: Path, *args: object) -> str:
+    """
+    Build a cache key from the input file identity and the forecast arguments.
+
+    The anticipy version is part of the key, so results cached by another
+    release are never reused.
+
+    Parameters
+    ----------
+    input_path:
+        Path to the input CSV file.
+    args:
+        Arguments that affect the forecast result.
+    """
+    stat = input_path.stat()
+    parts = [__version__, input_path.resolve(), stat.st_mtime_ns, stat.st_size, *args]
+    return hashlib.sha1("-".join(map(str, parts)).encode()).hexdigest()
+
+
+def _load_cached_result(
+    cache_dir: Path,
+    key: str,
+) -> tuple[pd.DataFrame, pd.DataFrame] | None:
+    """
+    Load cached forecast data and metadata, or return None on a cache miss.
+
+    Unreadable cache files, e.g. left by an interrupted run, count as a miss.
+
+    Parameters
+    ----------
+    cache_dir:
+        Directory holding cached results.
+    key:
+        Cache key from :func:`_get_cache_key`.
+    """
+    path_data = cache_dir / f"{key}.data.parquet"
+    path_metadata = cache_dir / f"{key}.meta.parquet"
+    if not (path_data.is_file() and path_metadata.is_file()):
+        return None
+    try:
+        return pd.read_parquet(path_data), pd.read_parquet(path_metadata)
+    except ImportError:
+        logger.info("No parquet engine available, ignoring forecast cache")
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable forecast cache in %s: %s", cache_dir, e)
+        return None
+
+
+def _save_cached_result(
+    cache_dir: Path,
+    key: str,
+    df_result: pd.DataFrame,
+    df_metadata: pd.DataFrame,
+) -> None:
+    """
+    Store forecast data and metadata as parquet files in the cache directory.
+
+    Object columns (e.g. fitted model instances) are stored as strings, which
+    is how they are written to the CSV outputs. Each file is written to a
+    temporary path and renamed, so an interrupted run never leaves a partial
+    cache entry. Failures to write the cache are logged, not raised.
+
+    Parameters
+    ----------
+    cache_dir:
+        Directory holding cached results.
+    key:
+        Cache key from :func:`_get_cache_key`.
+    df_result:
+        Forecast data.
+    df_metadata:
+        Forecast metadata.
+    """
+    path_tmp = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for df, suffix in [(df_result, "data"), (df_metadata, "meta")]:
+            df = _stringify_object_columns(df)
+            path = cache_dir / f"{key}.{suffix}.parquet"
+            path_tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            df.to_parquet(path_tmp, index=False)
+            os.replace(path_tmp, path)
+    except ImportError:
+        logger.info("No parquet engine available, forecast results not cached")
+    except Exception as e:
+        logger.warning("Could not cache forecast results in %s: %s", cache_dir, e)
+        if path_tmp is not None:
+            with contextlib.suppress(OSError):
+                path_tmp.unlink(missing_ok=True)
+
+
 def run_forecast_app(
     path_in: Path | str,
     path_out: Path | str | None = None,
@@ -42,6 +211,9 @@ def run_forecast_app(
     col_name_source: str = DEFAULT_COL_NAME_SOURCE,
     include_all_fits: bool = False,
     output_format: str = DEFAULT_OUTPUT_FORMAT,
+    use_cache: bool = True,
+    cache_dir: Path | str | None = None,
+    data_format: str = DEFAULT_DATA_FORMAT,
 ) -> None:
     """
     Run the forecast workflow for a CSV file and persist the outputs.
@@ -69,10 +241,20 @@ def run_forecast_app(
         Include non-optimal model fits in the output.
     output_format:
         Plot output format: png, html, or jupyter.
+    use_cache:
+        Reuse forecast results from previous runs with the same input file
+        and arguments, skipping model fitting.
+    cache_dir:
+        Directory for cached results. Defaults to a hidden folder in the
+        output directory.
+    data_format:
+        File format for forecast data and metadata: csv, parquet, or feather.
     """
     input_path = Path(path_in)
     if not input_path.exists() or not input_path.is_file():
         raise FileNotFoundError("path_in must point to an existing CSV file")
+    if data_format not in DATA_FORMATS:
+        raise ValueError(f"data_format must be one of {DATA_FORMATS}, got {data_format!r}")
 
     output_dir: Path = Path(path_out) if path_out is not None else input_path.parent
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -82,35 +264,57 @@ def run_forecast_app(
     path_metadata = output_dir / f"{file_stem}_metadata.csv"
     path_plot = output_dir / f"{file_stem}_fcast"
 
-    logger.info("Reading input CSV from %s", input_path)
-    df_y = pd.read_csv(input_path)
-
-    if col_name_date in df_y:
-        df_y[col_name_date] = df_y[col_name_date].pipe(pd.to_datetime)
-
-    df_y = forecast.normalize_df(
-        df_y,
+    cache_path = Path(cache_dir) if cache_dir is not None else output_dir / DEFAULT_CACHE_DIR_NAME
+    cache_key = _get_cache_key(
+        input_path,
+        forecast_years,
+        include_all_fits,
         col_name_y,
         col_name_weight,
         col_name_x,
         col_name_date,
         col_name_source,
     )
+    cached_result = _load_cached_result(cache_path, cache_key) if use_cache else None
 
-    dict_result = forecast.run_forecast(
-        df_y,
-        extrapolate_years=forecast_years,
-        simplify_output=False,
-        include_all_fits=include_all_fits,
-    )
+    if cached_result is not None:
+        logger.info("Using cached forecast results from %s", cache_path)
+        df_result, df_metadata = cached_result
+    else:
+        logger.info("Reading input CSV from %s", input_path)
+        df_y = _read_input_csv(
+            input_path,
+            [col_name_y, col_name_weight, col_name_x, col_name_date, col_name_source],
+            col_name_date,
+        )
+
+        df_y = forecast.normalize_df(
+            df_y,
+            col_name_y,
+            col_name_weight,
+            col_name_x,
+            col_name_date,
+            col_name_source,
+        )
+
+        dict_result = forecast.run_forecast(
+            df_y,
+            extrapolate_years=forecast_years,
+            simplify_output=False,
+            include_all_fits=include_all_fits,
+        )
+
+        df_result = dict_result["data"]
+        df_metadata = dict_result["metadata"]
 
-    df_result = dict_result["data"]
-    df_metadata = dict_result["metadata"]
+        if use_cache:
+            logger.info("Caching forecast results in %s", cache_path)
+            _save_cached_result(cache_path, cache_key, df_result, df_metadata)
 
-    logger.info("Writing forecast data to %s", path_data)
-    df_result.to_csv(path_data, index=False)
-    logger.info("Writing forecast metadata to %s", path_metadata)
-    df_metadata.to_csv(path_metadata, index=False)
+    path_data = _write_output_frame(df_result, path_data, data_format)
+    logger.info("Wrote forecast data to %s", path_data)
+    path_metadata = _write_output_frame(df_metadata, path_metadata, data_format)
+    logger.info("Wrote forecast metadata to %s", path_metadata)
 
     try:
         forecast_plot.plot_forecast(
@@ -183,6 +387,22 @@ def main(argv: list[str] | None = None) -> None:
         help="png, html or jupyter",
         default=DEFAULT_OUTPUT_FORMAT,
     )
+    parser.add_argument(
+        "--data_format",
+        help="csv, parquet or feather",
+        default=DEFAULT_DATA_FORMAT,
+        choices=DATA_FORMATS,
+    )
+    parser.add_argument(
+        "--no_cache",
+        help="If true, always refit models instead of reusing cached results",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--cache_dir",
+        help="Path of cache folder - defaults to a hidden folder in path_out",
+        default=None,
+    )
 
     args = parser.parse_args(argv)
     configure_logging()
@@ -199,6 +419,9 @@ def main(argv: list[str] | None = None) -> None:
         args.col_name_source,
         args.include_all_fits,
         args.output_format,
+        not args.no_cache,
+        args.cache_dir,
+        args.data_format,
     )
 
 
@@ -12,6 +12,7 @@ Functions to plot forecast outputs
 # docstrings
 
 # -- Public Imports
+import functools
 import importlib.util
 import logging
 import os
@@ -23,30 +24,330 @@ import pandas as pd
 # -- Globals
 logger = logging.getLogger(__name__)
 
-try:
-    import matplotlib.pyplot as plt
+_ipython_imported = importlib.util.find_spec("IPython") is not None
+if not _ipython_imported:
+    logger.info("IPython not available, skipping importing library...")
 
-    _matplotlib_imported = True
-except ImportError:
-    logger.info("Matplotlib not available, skipping importing library...")
-    _matplotlib_imported = False
+# Set once plotly.js has been injected into the current notebook
+_notebook_initialized = False
 
-try:
-    import plotly as py
-    import plotly.graph_objs as go
-    from plotly import subplots
+# Matplotlib trace styling
+_MPL_ACTUALS_COLOR = "#119da5"  # Teal actuals
+_MPL_FORECAST_COLOR = "#dc6450"  # Warm red forecast
+_MPL_ACTUALS_KWARGS = dict(
+    color=_MPL_ACTUALS_COLOR,
+    marker="o",
+    markersize=4,
+    linestyle="solid",
+    linewidth=1.5,
+    label="Actuals",
+    alpha=0.85,
+)
+_MPL_FORECAST_KWARGS = dict(
+    color=_MPL_FORECAST_COLOR,
+    marker="o",
+    markersize=3,
+    linestyle="solid",
+    linewidth=1.5,
+    label="Forecast",
+    alpha=0.80,
+)
 
-    _plotly_imported = True
-except ImportError:
-    logger.info("Plotly not available, skipping importing library...")
-    _plotly_imported = False
+# Plotly trace styling
+_ACTUALS_LINE = dict(color="rgb(17, 157, 165)", width=2)
+_ACTUALS_MARKER = dict(color="rgb(17, 157, 165)", size=4)
+_FORECAST_LINE = dict(color="rgb(220, 100, 80)", width=2)
+_FORECAST_MARKER = dict(color="rgb(220, 100, 80)", size=4)
+_BAND_LINE = dict(color="rgba(0,0,0,0)")
+_HOVER_TEMPLATE = "%{x|%Y-%m-%d}<br>%{y:.4g}<extra></extra>"
+_TICK_FONT = dict(size=8, family="Segoe UI, sans-serif", color="#666666")
 
-_ipython_imported = importlib.util.find_spec("IPython") is not None
-if not _ipython_imported:
-    logger.info("IPython not available, skipping importing library...")
+# Plotly axis styling, applied to all subplots through the layout template
+_XAXIS_STYLE = dict(
+    automargin=True,
+    tickfont=_TICK_FONT,
+    tickangle=-45,
+    tickformat="%Y-%m-%d",
+    gridcolor="#f5f5f5",
+    showgrid=False,
+    zeroline=False,
+    linewidth=1,
+    linecolor="#d0d0d0",
+    ticklen=4,
+)
+_YAXIS_STYLE = dict(
+    automargin=True,
+    tickfont=_TICK_FONT,
+    gridcolor="#eeeeee",
+    showgrid=True,
+    gridwidth=0.5,
+    zeroline=False,
+    linewidth=1,
+    linecolor="#d0d0d0",
+    ticklen=4,
+)
+
+
+# ---- Optional dependencies
+@functools.cache
+def _get_matplotlib():
+    """
+    Import matplotlib and the Agg rendering modules on first use.
+
+    :return: matplotlib module, or None if matplotlib is not installed
+    """
+    try:
+        import matplotlib
+        import matplotlib.backends.backend_agg
+        import matplotlib.dates
+        import matplotlib.figure
+        import matplotlib.style
+    except ImportError:
+        logger.info("Matplotlib not available, skipping importing library...")
+        return None
+    return matplotlib
+
+
+@functools.cache
+def _get_plotly():
+    """
+    Import plotly and its figure-building modules on first use.
+
+    :return: plotly module, or None if plotly is not installed
+    """
+    try:
+        import plotly
+        import plotly.graph_objs
+        import plotly.io
+        import plotly.offline
+        import plotly.subplots
+    except ImportError:
+        logger.info("Plotly not available, skipping importing library...")
+        return None
+    return plotly
+
+
+@functools.cache
+def _get_plotly_template():
+    """
+    Build the plotly layout template shared by all forecast figures.
+
+    Starts from plotly's active default template, adding the forecast axis
+    and background styles. Template axis styles apply to every subplot
+    axis, so they are set once instead of per axis.
+
+    :return: plotly layout template
+    """
+    py = _get_plotly()
+    template = py.graph_objs.layout.Template(py.io.templates[py.io.templates.default])
+    template.layout.update(
+        xaxis=_XAXIS_STYLE,
+        yaxis=_YAXIS_STYLE,
+        paper_bgcolor="#ffffff",
+        plot_bgcolor="#fafafa",
+    )
+    return template
+
+
+@functools.cache
+def _get_joblib():
+    """
+    Import joblib on first use, for rendering facets in parallel.
+
+    :return: joblib module, or None if joblib is not installed
+    """
+    try:
+        import joblib
+    except ImportError:
+        logger.info("joblib not available, skipping importing library...")
+        return None
+    return joblib
+
+
+@functools.cache
+def _get_lttb():
+    """
+    Compile :py:func:`_lttb` with numba on first use, if available.
+
+    The compiled function is cached on disk, so later processes skip
+    compilation.
+
+    :return: LTTB point selection function
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        logger.info("numba not available, using uncompiled LTTB downsampling")
+        return _lttb
+    return njit(cache=True, fastmath=True)(_lttb)
+
+
+# ---- Data reduction functions
+def _lttb(x, y, threshold):
+    """
+    Select points to keep with Largest-Triangle-Three-Buckets downsampling.
+
+    :param x: Sorted x values, as float64 array
+    :param y: Finite y values, as float64 array
+    :param threshold: Number of points to keep
+    :return: Sorted indices of the points to keep
+    """
+    n = x.shape[0]
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    idx = np.empty(threshold, dtype=np.int64)
+    idx[0] = 0
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third vertex of the triangle
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Keep the point in this bucket forming the largest triangle
+        start = int(i * bucket_size) + 1
+        end = next_start
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + np.argmax(area)
+        idx[i + 1] = a
+    idx[threshold - 1] = n - 1
+    return idx
+
+
+def _downsample_actuals(df_fcast, max_points, min_length=None):
+    """
+    Reduce long actuals series to at most max_points rows per source.
+
+    Forecast rows are left untouched. Rows with null values are dropped
+    from downsampled series.
+
+    :param df_fcast: Forecast DataFrame with columns: date, y, is_actuals
+    :param max_points: Number of points to keep per actuals series
+    :param min_length: Only downsample series longer than this,
+        defaults to max_points
+    :return: Filtered forecast DataFrame
+    """
+    min_length = max_points if min_length is None else min_length
+    if "source" in df_fcast.columns:
+        groups = df_fcast.groupby("source", sort=False, observed=True).indices
+    else:
+        groups = {"y": np.arange(len(df_fcast))}
+    is_actuals_arr = df_fcast["is_actuals"].to_numpy(dtype=bool)
+    x_arr = None
+    y_arr = df_fcast["y"].to_numpy(dtype=np.float64)
+
+    keep = np.ones(len(df_fcast), dtype=bool)
+    for idx in groups.values():
+        idx_act = idx[is_actuals_arr[idx]]
+        if len(idx_act) <= min_length:
+            continue
+        if x_arr is None:
+            # Integer epoch values, also for timezone-aware dates
+            x_arr = pd.DatetimeIndex(df_fcast["date"]).asi8.astype(np.float64)
+        idx_valid = idx_act[np.isfinite(y_arr[idx_act])]
+        idx_valid = idx_valid[np.argsort(x_arr[idx_valid], kind="stable")]
+        keep[idx_act] = False
+        idx_keep = _get_lttb()(x_arr[idx_valid], y_arr[idx_valid], max_points)
+        keep[idx_valid[idx_keep]] = True
+
+    return df_fcast if keep.all() else df_fcast.iloc[keep]
 
 
 # ---- Plotting functions
+def _matplotlib_draw_source(
+    ax,
+    date_act,
+    y_act,
+    date_fc,
+    y_fc,
+    pi_bands=(),
+    title=None,
+    show_legend=True,
+):
+    """
+    Draw actuals, forecast and prediction intervals for one source on an axis.
+
+    :param ax: Matplotlib axis to draw on
+    :param date_act: Dates of actuals
+    :param y_act: Values of actuals
+    :param date_fc: Dates of forecast
+    :param y_fc: Values of forecast
+    :param pi_bands: Sequence of (date, q_low, q_hi, alpha, label) fills
+    :param title: Axis title, or None to skip
+    :param show_legend: Display legend
+    """
+    mdates = _get_matplotlib().dates
+
+    # Plot actuals and forecast
+    ax.plot(date_act, y_act, **_MPL_ACTUALS_KWARGS)
+    ax.plot(date_fc, y_fc, **_MPL_FORECAST_KWARGS)
+
+    # Prediction interval fills
+    for date_fill, q_low, q_hi, alpha, label in pi_bands:
+        ax.fill_between(
+            date_fill,
+            q_low,
+            q_hi,
+            facecolor=_MPL_FORECAST_COLOR,
+            alpha=alpha,
+            label=label,
+        )
+
+    # Grid and styling
+    ax.grid(True, alpha=0.35, linestyle="-", linewidth=0.4, color="#eeeeee")
+    ax.set_facecolor("#fafafa")
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+    ax.spines["left"].set_color("#d0d0d0")
+    ax.spines["bottom"].set_color("#d0d0d0")
+    ax.spines["left"].set_linewidth(0.7)
+    ax.spines["bottom"].set_linewidth(0.7)
+    ax.tick_params(labelsize=8, colors="#666666", length=3, width=0.7)
+
+    # X-axis date formatting
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
+    ax.xaxis.set_tick_params(rotation=45, which="major")
+    for tick_label in ax.get_xticklabels():
+        tick_label.set_fontsize(8)
+        tick_label.set_color("#666666")
+
+    if title is not None:
+        ax.set_title(title, fontsize=10, fontweight="normal", color="#1f1f1f", pad=8)
+
+    if show_legend:
+        ax.legend(loc="best", fontsize=8, framealpha=0.95, edgecolor="#e0e0e0", fancybox=True)
+
+
+def _render_one_source(source_data, width, height, dpi, show_legend=True):
+    """
+    Render a single source to an RGBA pixel array, for use in worker processes.
+
+    Uses a standalone Agg figure so no pyplot state is touched in the worker.
+
+    :param source_data: Keyword arguments for :py:func:`_matplotlib_draw_source`
+    :param width: Tile width in pixels
+    :param height: Tile height in pixels
+    :param dpi: Rendering resolution
+    :param show_legend: Display legend
+    :return: RGBA image as a (height, width, 4) uint8 array
+    """
+    mpl = _get_matplotlib()
+    with mpl.style.context("default"):
+        fig = mpl.figure.Figure(figsize=(width / dpi, height / dpi), dpi=dpi, facecolor="#ffffff")
+        canvas = mpl.backends.backend_agg.FigureCanvasAgg(fig)
+        ax = fig.add_subplot(1, 1, 1)
+        _matplotlib_draw_source(ax, show_legend=show_legend, **source_data)
+        fig.tight_layout()
+        canvas.draw()
+        return np.asarray(canvas.buffer_rgba()).copy()
+
+
 def _matplotlib_forecast_create(
     df_fcast,
     subplots,
@@ -59,6 +360,8 @@ def _matplotlib_forecast_create(
     dpi=100,
     show_legend=True,
     include_interval=False,
+    n_jobs=1,
+    fig=None,
 ):
     """
     Generate matplotlib figure from forecast data.
@@ -74,135 +377,111 @@ def _matplotlib_forecast_create(
     :param dpi: Rendering resolution
     :param show_legend: Display legend
     :param include_interval: Display prediction intervals
+    :param n_jobs: Number of worker processes used to render facets.
+        If not 1 and joblib is available, each source is rendered to an
+        image tile in parallel and composited into the grid.
+    :param fig: Existing figure to clear and draw into, instead of
+        allocating a new one
     :return: Matplotlib figure
     """
-    assert _matplotlib_imported, "matplotlib required for PNG output"
+    mpl = _get_matplotlib()
+    assert mpl is not None, "matplotlib required for PNG output"
 
-    # Colors and styling
-    act_col = "#119da5"  # Teal actuals
-    for_col = "#dc6450"  # Warm red forecast
-    plt.style.use("default")
-    figsize = (width / dpi, height / dpi)
+    # Filter out weight rows; no copy needed as the frame is only read
+    is_weight = (df_fcast["model"] == "weight").to_numpy()
+    df_fcast = df_fcast.iloc[~is_weight].set_index("date")
 
-    # Filter out weight rows
-    df_fcast = df_fcast.loc[df_fcast.model != "weight"].copy()
-    df_fcast = df_fcast.set_index("date")
+    # Positional row indices per source, computed in a single pass
+    if subplots:
+        groups = df_fcast.groupby("source", sort=False, observed=True).indices
+    else:
+        groups = {src: np.arange(len(df_fcast)) for src in sources}
+    date_arr = df_fcast.index.values
+    y_arr = df_fcast["y"].to_numpy()
+    is_actuals_arr = df_fcast["is_actuals"].to_numpy(dtype=bool)
 
-    fig, axes = plt.subplots(
-        nrows=nrows,
-        ncols=ncols,
-        figsize=figsize,
-        dpi=dpi,
-        squeeze=False,
-        facecolor="#ffffff",
-    )
-    fig.suptitle(title, fontsize=12, fontweight="normal", color="#1f1f1f", y=0.98)
+    # Prediction interval bounds and their validity masks
+    pi_bands = []
+    if include_interval:
+        for str_q_low, str_q_hi, alpha, label in [
+            ("q5", "q95", 0.12, "95% PI"),
+            ("q20", "q80", 0.08, "80% PI"),
+        ]:
+            if str_q_low in df_fcast.columns and str_q_hi in df_fcast.columns:
+                q_low_arr = df_fcast[str_q_low].to_numpy()
+                q_hi_arr = df_fcast[str_q_hi].to_numpy()
+                q_valid = ~(pd.isna(q_low_arr) | pd.isna(q_hi_arr))
+                pi_bands.append((q_low_arr, q_hi_arr, q_valid, alpha, label))
 
-    x = 0
-    y = 0
+    # Per-source plot data
+    list_source_data = []
     for src in sources:
-        ax = axes[x, y]
-        source_filt = True if not subplots else (df_fcast["source"] == src)
-
-        # Plot actuals
-        ax.plot(
-            df_fcast.loc[source_filt & df_fcast["is_actuals"], :].index,
-            df_fcast.loc[source_filt & df_fcast["is_actuals"], "y"],
-            color=act_col,
-            marker="o",
-            markersize=4,
-            linestyle="solid",
-            linewidth=1.5,
-            label="Actuals",
-            alpha=0.85,
-        )
-
-        # Plot forecast
-        ax.plot(
-            df_fcast.loc[source_filt & ~df_fcast["is_actuals"], :].index,
-            df_fcast.loc[source_filt & ~df_fcast["is_actuals"], "y"],
-            color=for_col,
-            marker="o",
-            markersize=3,
-            linestyle="solid",
-            linewidth=1.5,
-            label="Forecast",
-            alpha=0.80,
-        )
-
-        # Prediction interval fills
-        if include_interval and "q5" in df_fcast.columns and "q95" in df_fcast.columns:
-            where_fill = (
-                source_filt
-                & (~df_fcast["is_actuals"])
-                & (df_fcast["q5"].notna())
-                & (df_fcast["q95"].notna())
+        idx = groups[src]
+        idx_act = idx[is_actuals_arr[idx]]
+        idx_fc = idx[~is_actuals_arr[idx]]
+        source_bands = []
+        for q_low_arr, q_hi_arr, q_valid, alpha, label in pi_bands:
+            idx_fill = idx_fc[q_valid[idx_fc]]
+            source_bands.append(
+                (date_arr[idx_fill], q_low_arr[idx_fill], q_hi_arr[idx_fill], alpha, label)
             )
-            ax.fill_between(
-                df_fcast[where_fill].index,
-                df_fcast.loc[where_fill, "q5"],
-                df_fcast.loc[where_fill, "q95"],
-                facecolor=for_col,
-                alpha=0.12,
-                label="95% PI",
+        list_source_data.append(
+            dict(
+                date_act=date_arr[idx_act],
+                y_act=y_arr[idx_act],
+                date_fc=date_arr[idx_fc],
+                y_fc=y_arr[idx_fc],
+                pi_bands=source_bands,
+                title=str(src) if subplots else None,
             )
+        )
 
-        if include_interval and "q20" in df_fcast.columns and "q80" in df_fcast.columns:
-            where_fill = (
-                source_filt
-                & (~df_fcast["is_actuals"])
-                & (df_fcast["q20"].notna())
-                & (df_fcast["q80"].notna())
+    tiles = None
+    if n_jobs != 1 and subplots:
+        joblib = _get_joblib()
+        if joblib is not None:
+            # Render each facet in a worker, then composite the tiles into the grid
+            tile_width = int(width / ncols)
+            tile_height = int(0.96 * height / nrows)
+            render = joblib.delayed(_render_one_source)
+            tiles = joblib.Parallel(n_jobs=n_jobs, backend="loky")(
+                render(source_data, tile_width, tile_height, dpi, show_legend)
+                for source_data in list_source_data
             )
-            ax.fill_between(
-                df_fcast[where_fill].index,
-                df_fcast.loc[where_fill, "q20"],
-                df_fcast.loc[where_fill, "q80"],
-                facecolor=for_col,
-                alpha=0.08,
-                label="80% PI",
+        else:
+            logger.info("joblib not available, rendering facets sequentially")
+
+    # Standalone Agg figure: no pyplot state or GUI backend involved
+    with mpl.style.context("default"):
+        if fig is None:
+            fig = mpl.figure.Figure(
+                figsize=(width / dpi, height / dpi), dpi=dpi, facecolor="#ffffff"
             )
+        else:
+            fig.clf()
+            fig.set_size_inches(width / dpi, height / dpi)
+            fig.set_dpi(dpi)
+            fig.set_facecolor("#ffffff")
+        if not isinstance(fig.canvas, mpl.backends.backend_agg.FigureCanvasAgg):
+            mpl.backends.backend_agg.FigureCanvasAgg(fig)
+        axes = fig.subplots(nrows=nrows, ncols=ncols, squeeze=False)
+        fig.suptitle(title, fontsize=12, fontweight="normal", color="#1f1f1f", y=0.98)
+
+        for i, source_data in enumerate(list_source_data):
+            r, c = divmod(i, ncols)
+            ax = axes[r, c]
+            if tiles is not None:
+                ax.imshow(tiles[i], aspect="auto", interpolation="none")
+                ax.set_axis_off()
+            else:
+                _matplotlib_draw_source(ax, show_legend=show_legend, **source_data)
 
-        # Grid and styling
-        ax.grid(True, alpha=0.35, linestyle="-", linewidth=0.4, color="#eeeeee")
-        ax.set_facecolor("#fafafa")
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        ax.spines["left"].set_color("#d0d0d0")
-        ax.spines["bottom"].set_color("#d0d0d0")
-        ax.spines["left"].set_linewidth(0.7)
-        ax.spines["bottom"].set_linewidth(0.7)
-        ax.tick_params(labelsize=8, colors="#666666", length=3, width=0.7)
-        
-        # X-axis date formatting
-        import matplotlib.dates as mdates
-        ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-        ax.xaxis.set_tick_params(rotation=45, which="major")
-        for label in ax.get_xticklabels():
-            label.set_fontsize(8)
-            label.set_color("#666666")
-
-        if subplots:
-            ax.set_title(src, fontsize=10, fontweight="normal", color="#1f1f1f", pad=8)
-
-        if show_legend:
-            ax.legend(loc="best", fontsize=8, framealpha=0.95, edgecolor="#e0e0e0", fancybox=True)
-
-        y += 1
-        if y >= ncols:
-            y = 0
-            x += 1
-
-    # Hide unused subplots
-    while x < nrows:
-        while y < ncols:
-            axes[x, y].set_visible(False)
-            y += 1
-        y = 0
-        x += 1
-
-    plt.tight_layout(rect=[0, 0, 1, 0.96])
+        # Hide unused subplots
+        for j in range(len(list_source_data), nrows * ncols):
+            r, c = divmod(j, ncols)
+            axes[r, c].set_visible(False)
+
+        fig.tight_layout(rect=[0, 0, 1, 0.96])
     return fig
 
 
@@ -220,6 +499,7 @@ def _plotly_forecast_create(
     include_interval=False,
     pi_q1=5,
     pi_q2=20,
+    use_gl=True,
 ):
     """
     Generate Plotly figure from forecast data.
@@ -237,15 +517,20 @@ def _plotly_forecast_create(
     :param include_interval: Display prediction intervals
     :param pi_q1: Outer percentile for PI (5%-95%)
     :param pi_q2: Inner percentile for PI (20%-80%)
+    :param use_gl: Render traces with WebGL (Scattergl) instead of SVG
     :return: Plotly figure
     """
-    assert _plotly_imported, "plotly required for HTML output"
+    py = _get_plotly()
+    assert py is not None, "plotly required for HTML output"
+    go = py.graph_objs
+
+    scatter = go.Scattergl if use_gl else go.Scatter
 
     vertical_spacing = 50.0 / height if height is not None else 0.1
 
     if use_subplots:
         titles = list(map(str, sources))
-        fig = subplots.make_subplots(
+        fig = py.subplots.make_subplots(
             rows=nrows,
             cols=ncols,
             subplot_titles=titles,
@@ -255,46 +540,57 @@ def _plotly_forecast_create(
         )
         margin_top = 50
     else:
-        fig = subplots.make_subplots(rows=nrows, cols=ncols, print_grid=False)
+        fig = py.subplots.make_subplots(rows=nrows, cols=ncols, print_grid=False)
         margin_top = 30
 
-    x = 1
-    y = 1
-    is_first_source = True
+    # Split the frame by source in a single pass
+    if use_subplots:
+        grouped = {s: g for s, g in df_fcast.groupby("source", sort=False, observed=True)}
+    else:
+        grouped = {"y": df_fcast}
 
-    for src in sources:
-        source_filt = True if not use_subplots else (df_fcast["source"] == src)
+    # Traces are collected and added in one call, with their subplot positions
+    traces, rows, cols = [], [], []
+    for i, src in enumerate(sources):
+        r, c = divmod(i, ncols)
+        is_first_source = i == 0
+        source_traces = []
+        sub = grouped[src]
+        act_mask = sub["is_actuals"].to_numpy(dtype=bool)
+        act = sub.iloc[act_mask]
+        fc = sub.iloc[~act_mask]
+        fc_date = fc["date"].to_numpy()
         actuals_name = "Actuals"
         forecasts_name = "Forecast"
 
         # Actuals line
-        actuals = go.Scatter(
-            x=df_fcast.loc[source_filt & df_fcast["is_actuals"]].date,
-            y=df_fcast.loc[source_filt & df_fcast["is_actuals"]].y,
+        actuals = scatter(
+            x=act["date"].to_numpy(),
+            y=act["y"].to_numpy(),
             name=actuals_name,
-            line=dict(color="rgb(17, 157, 165)", width=2),
-            marker=dict(color="rgb(17, 157, 165)", size=4),
+            line=_ACTUALS_LINE,
+            marker=_ACTUALS_MARKER,
             mode="lines+markers",
             opacity=0.85,
             legendgroup="actuals",
             showlegend=is_first_source,
-            hovertemplate="%{x|%Y-%m-%d}<br>%{y:.4g}<extra></extra>",
+            hovertemplate=_HOVER_TEMPLATE,
         )
-        fig.add_trace(actuals, x, y)
+        source_traces.append(actuals)
 
         # Forecast line
-        forecast = go.Scatter(
-            x=df_fcast.loc[source_filt & ~df_fcast["is_actuals"]].date,
-            y=df_fcast.loc[source_filt & ~df_fcast["is_actuals"]].y,
+        forecast = scatter(
+            x=fc_date,
+            y=fc["y"].to_numpy(),
             name=forecasts_name,
-            line=dict(color="rgb(220, 100, 80)", width=2),
-            marker=dict(color="rgb(220, 100, 80)", size=4),
+            line=_FORECAST_LINE,
+            marker=_FORECAST_MARKER,
             mode="lines+markers",
             legendgroup="forecast",
             showlegend=is_first_source,
-            hovertemplate="%{x|%Y-%m-%d}<br>%{y:.4g}<extra></extra>",
+            hovertemplate=_HOVER_TEMPLATE,
         )
-        fig.add_trace(forecast, x, y)
+        source_traces.append(forecast)
 
         # Prediction intervals
         if include_interval:
@@ -302,33 +598,33 @@ def _plotly_forecast_create(
                 str_q_low = f"q{pi_q}"
                 str_q_hi = f"q{100 - pi_q}"
                 if str_q_low in df_fcast.columns and str_q_hi in df_fcast.columns:
-                    q_low = go.Scatter(
-                        x=df_fcast.loc[source_filt & ~df_fcast["is_actuals"]].date,
-                        y=df_fcast.loc[source_filt & ~df_fcast["is_actuals"]][str_q_low],
-                        line=dict(color="rgba(0,0,0,0)"),
+                    q_low = scatter(
+                        x=fc_date,
+                        y=fc[str_q_low].to_numpy(),
+                        line=_BAND_LINE,
                         mode="lines",
                         showlegend=False,
                         hoverinfo="skip",
                     )
-                    fig.add_trace(q_low, x, y)
+                    source_traces.append(q_low)
 
-                    q_hi = go.Scatter(
-                        x=df_fcast.loc[source_filt & ~df_fcast["is_actuals"]].date,
-                        y=df_fcast.loc[source_filt & ~df_fcast["is_actuals"]][str_q_hi],
+                    q_hi = scatter(
+                        x=fc_date,
+                        y=fc[str_q_hi].to_numpy(),
                         fill="tonexty",
                         fillcolor=f"rgba(220, 100, 80, {0.12 if pi_q == pi_q1 else 0.08})",
-                        line=dict(color="rgba(0,0,0,0)"),
+                        line=_BAND_LINE,
                         mode="lines",
                         showlegend=False,
                         hoverinfo="skip",
                     )
-                    fig.add_trace(q_hi, x, y)
+                    source_traces.append(q_hi)
 
-        y += 1
-        if y > ncols:
-            y = 1
-            x += 1
-        is_first_source = False
+        traces += source_traces
+        rows += [r + 1] * len(source_traces)
+        cols += [c + 1] * len(source_traces)
+
+    fig.add_traces(traces, rows=rows, cols=cols)
 
     # Layout and theme configuration
     fig["layout"].update(
@@ -347,40 +643,11 @@ def _plotly_forecast_create(
             y=1.08,
         ),
         margin={"l": 55, "r": 40, "t": margin_top, "b": 50},
-        paper_bgcolor="#ffffff",
-        plot_bgcolor="#fafafa",
+        template=_get_plotly_template(),
         hovermode="x unified",
         font=dict(family="Segoe UI, sans-serif", size=9, color="#1f1f1f"),
     )
 
-    # Configure axes: optimized grid and typography
-    for key in fig["layout"]:
-        if key.startswith("xaxis"):
-            fig["layout"][key].update(
-                automargin=True,
-                tickfont=dict(size=8, family="Segoe UI, sans-serif", color="#666666"),
-                tickangle=-45,
-                tickformat="%Y-%m-%d",
-                gridcolor="#f5f5f5",
-                showgrid=False,
-                zeroline=False,
-                linewidth=1,
-                linecolor="#d0d0d0",
-                ticklen=4,
-            )
-        elif key.startswith("yaxis"):
-            fig["layout"][key].update(
-                automargin=True,
-                tickfont=dict(size=8, family="Segoe UI, sans-serif", color="#666666"),
-                gridcolor="#eeeeee",
-                showgrid=True,
-                gridwidth=0.5,
-                zeroline=False,
-                linewidth=1,
-                linecolor="#d0d0d0",
-                ticklen=4,
-            )
-
     if not use_subplots and add_rangeslider:
         fig["layout"].update(
             xaxis=dict(rangeslider=dict(visible=True, thickness=0.05), type="date")
@@ -389,6 +656,295 @@ def _plotly_forecast_create(
     return fig
 
 
+def _prepare_plot_data(df_fcast, max_points_per_trace, min_length=None):
+    """
+    Validate forecast data and lay out one subplot per source.
+
+    :param df_fcast: Forecast DataFrame with columns: date, model, y, is_actuals
+    :param max_points_per_trace: Downsample actuals series longer than this,
+        or None to keep every point
+    :param min_length: Only downsample series longer than this
+    :return: tuple (df_fcast, subplots, sources, nrows, ncols), or None if
+        the date column is missing or cannot be parsed
+    """
+    assert isinstance(df_fcast, pd.DataFrame)
+
+    # Validate and coerce date column to datetime
+    if "date" not in df_fcast.columns:
+        logger.error("DataFrame missing required 'date' column")
+        return None
+
+    if not pd.api.types.is_datetime64_any_dtype(df_fcast["date"]):
+        try:
+            df_fcast = df_fcast.assign(date=pd.to_datetime(df_fcast["date"], cache=True))
+        except Exception as e:
+            logger.error("Failed to convert 'date' column to datetime: %s", e)
+            return None
+
+    # Low-cardinality labels as categoricals: compares and groupbys run on integer codes
+    for col in ("source", "model"):
+        if (
+            col in df_fcast.columns
+            and not isinstance(df_fcast[col].dtype, pd.CategoricalDtype)
+            and pd.api.types.is_string_dtype(df_fcast[col])
+        ):
+            df_fcast = df_fcast.assign(**{col: df_fcast[col].astype("category")})
+
+    # Determine if we need subplots based on multiple sources
+    src_col = df_fcast.get("source")
+    is_categorical_source = src_col is not None and isinstance(
+        src_col.dtype, pd.CategoricalDtype
+    )
+    if src_col is None:
+        multi_source = False
+    elif is_categorical_source:
+        # Count labels in use, so unused categories left by filtering add no facets
+        codes = src_col.cat.codes.to_numpy()
+        multi_source = len(pd.unique(codes[codes >= 0])) > 1
+    else:
+        multi_source = src_col.nunique() > 1
+
+    # One facet per non-null source label: whatever the column dtype, rows
+    # with a null label are not plotted
+    if multi_source:
+        subplots = True
+        is_actuals_arr = df_fcast["is_actuals"].to_numpy(dtype=bool)
+        if is_categorical_source:
+            # Unique codes in order of appearance, skipping nulls (code -1)
+            codes_act = codes[is_actuals_arr]
+            sources = src_col.cat.categories.take(pd.unique(codes_act[codes_act >= 0]))
+        else:
+            sources = src_col[is_actuals_arr].dropna().unique()
+        num_plots = len(sources)
+        nrows = int(np.ceil(np.sqrt(num_plots)))
+        ncols = int(np.ceil(1.0 * num_plots / nrows))
+    else:
+        subplots = False
+        sources = ["y"]
+        nrows = 1
+        ncols = 1
+
+    if max_points_per_trace is not None:
+        df_fcast = _downsample_actuals(df_fcast, max_points_per_trace, min_length)
+
+    return df_fcast, subplots, sources, nrows, ncols
+
+
+def _ensure_output_dir(path):
+    """
+    Create the parent folder of an output file if it does not exist.
+
+    :param path: Output file path
+    """
+    dirname, _ = os.path.split(path)
+    if dirname and not os.path.exists(dirname):
+        logger.info("Creating output directory %s", dirname)
+        os.makedirs(dirname, exist_ok=True)
+
+
+def plot_forecast_png(
+    df_fcast,
+    path,
+    width=None,
+    height=None,
+    title=None,
+    dpi=100,
+    show_legend=True,
+    auto_open=False,
+    include_interval=False,
+    n_jobs=1,
+    max_points_per_trace=4000,
+    pil_kwargs=None,
+    fig=None,
+):
+    """
+    Generate and save forecast plot as PNG, using matplotlib.
+
+    Equivalent to :py:func:`plot_forecast` with output="png", see there for
+    the description of parameters.
+
+    :return: 0 on success, 1 on failure
+    """
+    if width is None:
+        width = 1000
+    if height is None:
+        height = 600
+
+    if not path:
+        logger.error("No export path provided.")
+        return 1
+
+    if _get_matplotlib() is None:
+        logger.error("matplotlib not installed; PNG export unavailable")
+        return 1
+
+    min_length = None if max_points_per_trace is None else max(max_points_per_trace, width)
+    plot_data = _prepare_plot_data(df_fcast, max_points_per_trace, min_length)
+    if plot_data is None:
+        return 1
+    df_fcast, subplots, sources, nrows, ncols = plot_data
+
+    fig = _matplotlib_forecast_create(
+        df_fcast,
+        subplots,
+        sources,
+        nrows,
+        ncols,
+        width,
+        height,
+        title,
+        dpi,
+        show_legend,
+        include_interval,
+        n_jobs,
+        fig,
+    )
+
+    path = f"{path}.png"
+    _ensure_output_dir(path)
+    fig.savefig(
+        path,
+        dpi=dpi,
+        bbox_inches="tight",
+        facecolor="#ffffff",
+        pil_kwargs=pil_kwargs,
+    )
+
+    if auto_open:
+        fileurl = f"file://{path}"
+        webbrowser.open(fileurl, new=2, autoraise=True)
+    return 0
+
+
+def plot_forecast_html(
+    df_fcast,
+    path,
+    width=None,
+    height=None,
+    title=None,
+    show_legend=True,
+    auto_open=False,
+    include_interval=False,
+    pi_q1=5,
+    pi_q2=20,
+    use_gl=True,
+    max_points_per_trace=4000,
+    include_plotlyjs="cdn",
+):
+    """
+    Generate and save forecast plot as interactive HTML, using plotly.
+
+    Equivalent to :py:func:`plot_forecast` with output="html", see there for
+    the description of parameters.
+
+    :return: 0 on success, 1 on failure
+    """
+    if width is None:
+        width = 1000
+    if height is None:
+        height = 600
+
+    if not path:
+        logger.error("No export path provided.")
+        return 1
+
+    if _get_plotly() is None:
+        logger.error("plotly not installed; HTML export unavailable")
+        return 1
+
+    plot_data = _prepare_plot_data(df_fcast, max_points_per_trace)
+    if plot_data is None:
+        return 1
+    df_fcast, subplots, sources, nrows, ncols = plot_data
+
+    fig = _plotly_forecast_create(
+        df_fcast,
+        use_subplots=subplots,
+        sources=sources,
+        nrows=nrows,
+        ncols=ncols,
+        width=width,
+        height=height,
+        title=title,
+        show_legend=show_legend,
+        add_rangeslider=False,  # Currently disabled
+        include_interval=include_interval,
+        pi_q1=pi_q1,
+        pi_q2=pi_q2,
+        use_gl=use_gl,
+    )
+    path = f"{path}.html"
+    _ensure_output_dir(path)
+    # The figure is built from validated trace objects, skip revalidation
+    html = fig.to_html(include_plotlyjs=include_plotlyjs, full_html=True, validate=False)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+    if auto_open:
+        fileurl = f"file://{path}"
+        webbrowser.open(fileurl, new=2, autoraise=True)
+    return 0
+
+
+def plot_forecast_jupyter(
+    df_fcast,
+    width=None,
+    height=None,
+    title=None,
+    show_legend=True,
+    include_interval=False,
+    pi_q1=5,
+    pi_q2=20,
+    use_gl=True,
+    max_points_per_trace=4000,
+):
+    """
+    Display forecast plot in a Jupyter notebook, using plotly.
+
+    Equivalent to :py:func:`plot_forecast` with output="jupyter", see there
+    for the description of parameters.
+
+    :return: plotly iplot result, or 1 on failure
+    """
+    global _notebook_initialized
+
+    if width is None:
+        width = 1000
+    if height is None:
+        height = 600
+
+    py = _get_plotly()
+    if py is None or not _ipython_imported:
+        logger.error("plotly and ipython required for Jupyter output")
+        return 1
+
+    plot_data = _prepare_plot_data(df_fcast, max_points_per_trace)
+    if plot_data is None:
+        return 1
+    df_fcast, subplots, sources, nrows, ncols = plot_data
+
+    if not _notebook_initialized:
+        py.offline.init_notebook_mode(connected=True)
+        _notebook_initialized = True
+    fig = _plotly_forecast_create(
+        df_fcast,
+        use_subplots=subplots,
+        sources=sources,
+        nrows=nrows,
+        ncols=ncols,
+        width=width,
+        height=height,
+        title=title,
+        show_legend=show_legend,
+        add_rangeslider=False,  # Currently disabled
+        include_interval=include_interval,
+        pi_q1=pi_q1,
+        pi_q2=pi_q2,
+        use_gl=use_gl,
+    )
+    return py.offline.iplot(fig, show_link=False)
+
+
 def plot_forecast(
     df_fcast,
     output="html",
@@ -402,6 +958,12 @@ def plot_forecast(
     include_interval=False,
     pi_q1=5,
     pi_q2=20,
+    use_gl=True,
+    n_jobs=1,
+    max_points_per_trace=4000,
+    pil_kwargs=None,
+    fig=None,
+    include_plotlyjs="cdn",
 ):
     """
     Generate and save forecast plot as PNG or HTML.
@@ -418,136 +980,76 @@ def plot_forecast(
     :param include_interval: Display prediction intervals
     :param pi_q1: Outer percentile for PI (5%-95%)
     :param pi_q2: Inner percentile for PI (20%-80%)
-    :return: 0 on success, 1 on failure
-    """
-    assert isinstance(df_fcast, pd.DataFrame)
-
-    # Validate and coerce date column to datetime
-    if "date" not in df_fcast.columns:
-        logger.error("DataFrame missing required 'date' column")
-        return 1
-    
-    if not pd.api.types.is_datetime64_any_dtype(df_fcast["date"]):
-        try:
-            df_fcast = df_fcast.copy()
-            df_fcast["date"] = pd.to_datetime(df_fcast["date"])
-        except Exception as e:
-            logger.error("Failed to convert 'date' column to datetime: %s", e)
-            return 1
-
-    # Set sensible defaults for dimensions if not provided
-    if width is None:
-        width = 1000
-    if height is None:
-        height = 600
-
-    add_rangeslider = False  # Currently disabled
-
-    if not path and (output == "html" or output == "png"):
-        logger.error("No export path provided.")
-        return 1
-
-    # Determine if we need subplots based on multiple sources
-    if "source" in df_fcast.columns and df_fcast.source.nunique() > 1:
-        subplots = True
-        sources = df_fcast.loc[df_fcast["is_actuals"], "source"].unique()
-        num_plots = len(sources)
-        nrows = int(np.ceil(np.sqrt(num_plots)))
-        ncols = int(np.ceil(1.0 * num_plots / nrows))
-    else:
-        subplots = False
-        sources = ["y"]
-        nrows = 1
-        ncols = 1
+    :param use_gl: For html/jupyter output, render traces with WebGL, which
+        scales to long series far better than SVG
+    :param n_jobs: For png output with multiple sources, number of worker
+        processes used to render facets in parallel (requires joblib)
+    :param max_points_per_trace: Downsample actuals series longer than this
+        with LTTB, preserving their visual shape. For png output, only
+        series longer than the plot width in pixels are reduced. Set to None
+        to plot every point.
+    :param pil_kwargs: For png output, keyword arguments for the PIL image
+        writer, e.g. {"compress_level": 1} for faster, larger files
+    :param fig: For png output, an existing matplotlib figure to clear and
+        reuse, saving the figure setup cost when rendering many plots
+    :param include_plotlyjs: For html output, how plotly.js is included:
+        "cdn" to load it from the plotly CDN, True to embed it in the file
+        (about 3.5MB) or False to leave it out
+    :return: 0 on success, 1 on failure. For jupyter output, the plotly
+        iplot result on success.
 
+    To render many plots in one format, :py:func:`plot_forecast_png`,
+    :py:func:`plot_forecast_html` and :py:func:`plot_forecast_jupyter`
+    can be called directly.
+    """
     if output == "png":
-        if _matplotlib_imported:
-            fig = _matplotlib_forecast_create(
-                df_fcast,
-                subplots,
-                sources,
-                nrows,
-                ncols,
-                width,
-                height,
-                title,
-                dpi,
-                show_legend,
-                include_interval,
-            )
-
-            path = f"{path}.png"
-            dirname, _ = os.path.split(path)
-            if dirname and not os.path.exists(dirname):
-                logger.info("Creating output directory %s", dirname)
-                os.makedirs(dirname, exist_ok=True)
-            plt.savefig(path, dpi=dpi, bbox_inches="tight", facecolor="#ffffff")
-            plt.close(fig)
-
-            if auto_open:
-                fileurl = f"file://{path}"
-                webbrowser.open(fileurl, new=2, autoraise=True)
-        else:
-            logger.error("matplotlib not installed; PNG export unavailable")
-            return 1
-
+        return plot_forecast_png(
+            df_fcast,
+            path,
+            width=width,
+            height=height,
+            title=title,
+            dpi=dpi,
+            show_legend=show_legend,
+            auto_open=auto_open,
+            include_interval=include_interval,
+            n_jobs=n_jobs,
+            max_points_per_trace=max_points_per_trace,
+            pil_kwargs=pil_kwargs,
+            fig=fig,
+        )
     elif output == "html":
-        if _plotly_imported:
-            fig = _plotly_forecast_create(
-                df_fcast,
-                use_subplots=subplots,
-                sources=sources,
-                nrows=nrows,
-                ncols=ncols,
-                width=width,
-                height=height,
-                title=title,
-                show_legend=show_legend,
-                add_rangeslider=add_rangeslider,
-                include_interval=include_interval,
-                pi_q1=pi_q1,
-                pi_q2=pi_q2,
-            )
-            path = f"{path}.html"
-            dirname, _ = os.path.split(path)
-            if dirname and not os.path.exists(dirname):
-                logger.info("Creating output directory %s", dirname)
-                os.makedirs(dirname, exist_ok=True)
-            py.offline.plot(
-                fig, filename=path, show_link=False, auto_open=auto_open, include_plotlyjs="cdn"
-            )
-        else:
-            logger.error("plotly not installed; HTML export unavailable")
-            return 1
-
+        return plot_forecast_html(
+            df_fcast,
+            path,
+            width=width,
+            height=height,
+            title=title,
+            show_legend=show_legend,
+            auto_open=auto_open,
+            include_interval=include_interval,
+            pi_q1=pi_q1,
+            pi_q2=pi_q2,
+            use_gl=use_gl,
+            max_points_per_trace=max_points_per_trace,
+            include_plotlyjs=include_plotlyjs,
+        )
     elif output == "jupyter":
-        if _plotly_imported and _ipython_imported:
-            py.offline.init_notebook_mode(connected=True)
-            fig = _plotly_forecast_create(
-                df_fcast,
-                use_subplots=subplots,
-                sources=sources,
-                nrows=nrows,
-                ncols=ncols,
-                width=width,
-                height=height,
-                title=title,
-                show_legend=show_legend,
-                add_rangeslider=add_rangeslider,
-                include_interval=include_interval,
-                pi_q1=pi_q1,
-                pi_q2=pi_q2,
-            )
-            return py.offline.iplot(fig, show_link=False)
-        else:
-            logger.error("plotly and ipython required for Jupyter output")
-            return 1
-
+        return plot_forecast_jupyter(
+            df_fcast,
+            width=width,
+            height=height,
+            title=title,
+            show_legend=show_legend,
+            include_interval=include_interval,
+            pi_q1=pi_q1,
+            pi_q2=pi_q2,
+            use_gl=use_gl,
+            max_points_per_trace=max_points_per_trace,
+        )
     else:
         logger.error(
             "Invalid output format '%s'. Supported formats: 'png', 'html', 'jupyter'.",
             output,
         )
         return 1
-
-    return 0
@@ -21,6 +21,8 @@ EXTRAS_REQUIRE = {
         "ipython>=8.0.0",
         "notebook>=7.0.0",
         "ipywidgets>=8.1.2",
+        "joblib>=1.3.0",
+        "numba>=0.60.0",
     ],
     "dev": [
         "ruff>=0.4.0",
@@ -28,6 +30,7 @@ EXTRAS_REQUIRE = {
         "pytest>=8.0.0",
         "pytest-html>=4.0.0",
         "pytest-cov>=4.0.0",
+        "pytest-xdist>=3.5.0",
     ],
 }
 ENTRY_POINTS = {
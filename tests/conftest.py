@@ -0,0 +1,61 @@
+#
+# License:          This module is released under the terms of the LICENSE file
+#                   contained within this applications INSTALL directory
+
+"""
+Shared pytest fixtures.
+
+Plotting library fixtures are module-scoped, so their import and warm-up
+cost is paid once per test module instead of once per test.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# forecast_plot draws on Agg canvases without pyplot and imports matplotlib
+# lazily, so this only matters if something else imports pyplot: pin the
+# non-interactive backend so it never probes for a GUI toolkit
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from anticipy import forecast_plot  # noqa: E402
+
+# Test plots are throwaway: write them to RAM-backed storage where available
+_tmp_root = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+@pytest.fixture(scope="module")
+def matplotlib_warm():
+    """matplotlib with the Agg rendering modules imported; skips if missing."""
+    mpl = forecast_plot._get_matplotlib()
+    if mpl is None:
+        pytest.skip("Matplotlib not installed")
+    return mpl
+
+
+@pytest.fixture(scope="module")
+def shared_figure(matplotlib_warm):
+    """Figure reused across PNG tests, cleared by plot_forecast before each plot."""
+    return matplotlib_warm.figure.Figure()
+
+
+@pytest.fixture(scope="module")
+def plotly_warm():
+    """plotly with the layout template and HTML writer warmed up; skips if missing."""
+    py = forecast_plot._get_plotly()
+    if py is None:
+        pytest.skip("Plotly not installed")
+    forecast_plot._get_plotly_template()
+    py.io.to_html(py.graph_objs.Figure(), include_plotlyjs=False, validate=False)
+    return py
+
+
+@pytest.fixture
+def plot_folder():
+    """Temporary folder for plot output, removed after the test."""
+    folder = Path(tempfile.mkdtemp(prefix="anticipy_plots_", dir=_tmp_root))
+    yield folder
+    shutil.rmtree(folder, ignore_errors=True)
@@ -0,0 +1,180 @@
+#
+# License:          This module is released under the terms of the LICENSE file
+#                   contained within this applications INSTALL directory
+
+"""
+Unit tests for the forecast CLI application.
+"""
+
+import importlib.util
+import logging
+import shutil
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from anticipy import app, forecast
+from anticipy.utils_test import PandasTest
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+samples_folder = Path(__file__).parent / "data"
+
+_pyarrow_installed = importlib.util.find_spec("pyarrow") is not None
+
+
+def _df_output():
+    """Output table with the column types written by the app."""
+    return pd.DataFrame({
+        "date": pd.to_datetime(["2017-01-29", "2017-02-05"]),
+        "weight": [1.0, 0.5],
+        "y": [7.1190596102394474, 6.0],
+        "model": ["actuals", "naive"],
+        "is_actuals": [True, False],
+        "model_obj": pd.Series([("linear", 2), ("naive", 1)], dtype=object),
+    })
+
+
+class TestWriteOutputFrame(PandasTest):
+    """Test writing forecast output tables."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.folder = Path(tmp_dir.name)
+
+    def test_write_csv(self):
+        """Test CSV output keeps the pandas quoting, date and bool format."""
+        path = app._write_output_frame(_df_output(), self.folder / "out.csv", "csv")
+        self.assertEqual(path, self.folder / "out.csv")
+        self.assertEqual(
+            path.read_text().splitlines(),
+            [
+                "date,weight,y,model,is_actuals,model_obj",
+                "2017-01-29,1.0,7.1190596102394474,actuals,True,\"('linear', 2)\"",
+                "2017-02-05,0.5,6.0,naive,False,\"('naive', 1)\"",
+            ],
+        )
+
+    def test_write_csv_missing_values(self):
+        """Test missing values in object columns are written as empty fields."""
+        df = pd.DataFrame({
+            "model": pd.Series(["naive", None], dtype=object),
+            "model_obj": pd.Series([("naive", 1), None], dtype=object),
+        })
+        path = app._write_output_frame(df, self.folder / "out.csv", "csv")
+        self.assertEqual(
+            path.read_text().splitlines(),
+            ["model,model_obj", "naive,\"('naive', 1)\"", ","],
+        )
+
+    def test_stringify_object_columns(self):
+        """Test only object columns are converted, without deprecation warnings."""
+        df = _df_output()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            df_result = app._stringify_object_columns(df)
+        self.assertEqual(df_result["model_obj"].tolist(), ["('linear', 2)", "('naive', 1)"])
+        self.assert_series_equal(df_result["model"], df["model"])
+        self.assert_series_equal(df_result["date"], df["date"])
+
+    @unittest.skipUnless(_pyarrow_installed, "pyarrow not installed")
+    def test_write_binary(self):
+        """Test parquet and feather output replace the suffix and round-trip."""
+        df = _df_output()
+        df_expected = df.assign(model_obj=df["model_obj"].astype(str))
+        for data_format, read in [("parquet", pd.read_parquet), ("feather", pd.read_feather)]:
+            with self.subTest(data_format):
+                path = app._write_output_frame(df, self.folder / "out.csv", data_format)
+                self.assertEqual(path, self.folder / f"out.{data_format}")
+                self.assert_frame_equal(read(path), df_expected, check_dtype=False)
+
+
+class TestForecastCache(PandasTest):
+    """Test reuse of cached forecast results across runs."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.folder = Path(tmp_dir.name)
+        self.path_in = self.folder / "df_test_naive.csv"
+        shutil.copyfile(samples_folder / "df_test_naive.csv", self.path_in)
+        self.cache_dir = self.folder / app.DEFAULT_CACHE_DIR_NAME
+
+        # Count model fits, without changing their results
+        patcher = mock.patch.object(app.forecast, "run_forecast", wraps=forecast.run_forecast)
+        self.run_forecast = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, **kwargs):
+        """Run the app on the input copy and return its forecast data."""
+        app.run_forecast_app(self.path_in, output_format="html", **kwargs)
+        return pd.read_csv(self.folder / "df_test_naive_fcast.csv")
+
+    @unittest.skipUnless(_pyarrow_installed, "pyarrow not installed")
+    def test_cache_hit(self):
+        """Test a second run with the same input reuses the first result."""
+        df_first = self._run()
+        self.assertEqual(self.run_forecast.call_count, 1)
+        self.assertTrue(any(self.cache_dir.iterdir()))
+
+        df_second = self._run()
+        self.assertEqual(self.run_forecast.call_count, 1)
+        self.assert_frame_equal(df_second, df_first)
+
+    def test_cache_miss(self):
+        """Test changed forecast arguments refit the models."""
+        self._run()
+        self._run(forecast_years=1.0)
+        self.assertEqual(self.run_forecast.call_count, 2)
+
+    def test_cache_invalidated_on_input_change(self):
+        """Test changes to the input file refit the models."""
+        self._run()
+        with self.path_in.open("a") as f:
+            f.write("2018-07-29,7.0\n")
+        self._run()
+        self.assertEqual(self.run_forecast.call_count, 2)
+
+    def test_cache_key_version(self):
+        """Test results cached by another anticipy release are not reused."""
+        key = app._get_cache_key(self.path_in, 2.0)
+        self.assertEqual(app._get_cache_key(self.path_in, 2.0), key)
+        with mock.patch.object(app, "__version__", "0.0.0"):
+            self.assertNotEqual(app._get_cache_key(self.path_in, 2.0), key)
+
+    def test_no_cache(self):
+        """Test --no_cache refits the models and writes no cache folder."""
+        argv = ["--path_in", str(self.path_in), "--output_format", "html", "--no_cache"]
+        app.main(argv)
+        app.main(argv)
+        self.assertEqual(self.run_forecast.call_count, 2)
+        self.assertFalse(self.cache_dir.exists())
+
+    @unittest.skipUnless(_pyarrow_installed, "pyarrow not installed")
+    def test_cache_corrupt(self):
+        """Test a truncated cache entry is refitted and replaced."""
+        df_first = self._run()
+        path_meta = next(self.cache_dir.glob("*.meta.parquet"))
+        path_meta.write_bytes(path_meta.read_bytes()[:10])
+
+        df_second = self._run()
+        self.assertEqual(self.run_forecast.call_count, 2)
+        self.assert_frame_equal(df_second, df_first)
+        # The refit replaced the broken entry, leaving no temporary files
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 2)
+        self._run()
+        self.assertEqual(self.run_forecast.call_count, 2)
+
+    def test_cache_write_failure(self):
+        """Test a cache that cannot be written does not stop the run."""
+        cache_file = self.folder / "not_a_folder"
+        cache_file.write_text("")
+        app.run_forecast_app(self.path_in, output_format="html", cache_dir=cache_file)
+        self.assertTrue((self.folder / "df_test_naive_fcast.csv").is_file())
+        self.assertTrue((self.folder / "df_test_naive_metadata.csv").is_file())
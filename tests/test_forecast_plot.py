@@ -9,294 +9,489 @@ Tests single and multiple time series plots in PNG and HTML formats,
 including prediction intervals and faceted layouts.
 """
 
+import functools
 import logging
 import os
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from anticipy import forecast_plot
-from anticipy.utils_test import PandasTest
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-base_folder = os.path.join(os.path.dirname(__file__), "test_plots")
-samples_folder = os.path.join(os.path.dirname(__file__), "data")
-if not os.path.exists(base_folder):
-    os.makedirs(base_folder)
-
-
-def get_file_path(folder, name):
-    """Return path to test output file."""
-    return os.path.join(folder, name)
-
-
-# Sample data: actuals and forecast without prediction intervals
-df_forecast = pd.concat(
-    [
-        pd.DataFrame({
-            "date": pd.date_range("2018-01-01", periods=6, freq="D"),
-            "model": "actuals",
-            "y": 1000 * np.arange(0.0, 6.0),
-            "is_actuals": True,
-        }),
-        pd.DataFrame({
-            "date": pd.date_range("2018-01-01", periods=10, freq="D"),
-            "model": "forecast",
-            "y": 1000 * np.full(10, 5.0),
-            "is_actuals": False,
-        }),
-    ],
-    sort=False,
-    ignore_index=True,
-)
-
-# Multi-source data for faceted plots
-_sources = ["ts1", "ts2", "ts3", "ts4", "ts5"]
-df_forecast_facet = pd.concat(
-    [df_forecast.assign(source=src) for src in _sources],
-    sort=False,
-    ignore_index=True,
-)
-
-# Data with prediction intervals (single source)
-df_forecast_pi = pd.read_csv(get_file_path(samples_folder, "df_test_forecast.csv"))
-
-# Data with prediction intervals and multiple sources
-df_forecast_pi_facet = pd.read_csv(get_file_path(samples_folder, "df_test_forecast_mds.csv"))
-
-
-class TestForecastPlotPNG(PandasTest):
-    """Test matplotlib PNG plot generation."""
-
-    def test_plot_single_series_png(self):
-        """Test PNG output for single time series."""
-        if not forecast_plot._matplotlib_imported:
-            self.skipTest("Matplotlib not installed")
-
-        path = get_file_path(base_folder, "test_mpl_single")
-        result = forecast_plot.plot_forecast(
-            df_forecast,
-            "png",
-            path,
-            width=900,
-            height=600,
-            title="Single Series Forecast",
-            show_legend=False,
-        )
-        self.assertEqual(result, 0)
-        self.assertTrue(os.path.isfile(f"{path}.png"))
+samples_folder = Path(__file__).parent / "data"
+
+# Test PNGs are throwaway: skip zlib's slow high-compression search
+_PNG_PIL_KWARGS = {"compress_level": 1}
+
+
+def _load_cached(csv_path):
+    """
+    Load a CSV fixture, caching the parsed frame as a pickle next to it.
+
+    The pickle is reused while it is newer than the CSV file. It is written
+    to a temporary file and renamed, so parallel test workers never read a
+    partial cache. If it cannot be written, the parsed frame is still used.
+    """
+    cache_path = f"{csv_path}.pkl"
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(csv_path):
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception:
+            logger.info("Unreadable fixture cache %s, parsing CSV", cache_path)
+    try:
+        df = pd.read_csv(csv_path, engine="pyarrow", parse_dates=["date"])
+    except ImportError:
+        df = pd.read_csv(csv_path, parse_dates=["date"])
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # Read-only checkouts still get the parsed frame
+        logger.info("Could not write fixture cache %s: %s", cache_path, e)
+    return df
+
+
+def _as_categories(df):
+    """
+    Store the low-cardinality source and model labels as categoricals.
+
+    plot_forecast converts string labels itself; converting the cached
+    fixtures once spares every test that work.
+    """
+    cols = [col for col in ("source", "model") if col in df.columns]
+    return df.astype(dict.fromkeys(cols, "category"))
+
+
+# Sample data, built on first use so filtered test runs skip unused fixtures
+_Y_ACTUALS = 1000.0 * np.arange(6.0)
+_Y_FORECAST = np.full(10, 5000.0)
+
+
+@functools.cache
+def _df_forecast():
+    """Actuals and forecast without prediction intervals."""
+    counts = [len(_Y_ACTUALS), len(_Y_FORECAST)]
+    return pd.DataFrame({
+        "date": np.concatenate([
+            np.arange("2018-01-01", "2018-01-07", dtype="datetime64[D]"),
+            np.arange("2018-01-01", "2018-01-11", dtype="datetime64[D]"),
+        ]),
+        "model": pd.Categorical(np.repeat(["actuals", "forecast"], counts)),
+        "y": np.concatenate([_Y_ACTUALS, _Y_FORECAST]),
+        "is_actuals": np.repeat([True, False], counts),
+    })
 
-    def test_plot_facet_png(self):
-        """Test PNG output with faceted layout for multiple sources."""
-        if not forecast_plot._matplotlib_imported:
-            self.skipTest("Matplotlib not installed")
 
-        path = get_file_path(base_folder, "test_mpl_facet")
-        result = forecast_plot.plot_forecast(
-            df_forecast_facet,
-            "png",
-            path,
-            width=1200,
-            height=900,
-            title="Multi-Source Forecast",
-            show_legend=True,
-        )
-        self.assertEqual(result, 0)
-        self.assertTrue(os.path.isfile(f"{path}.png"))
+_sources = ["ts1", "ts2", "ts3", "ts4", "ts5"]
 
-    def test_plot_with_intervals_png(self):
-        """Test PNG output with prediction intervals."""
-        if not forecast_plot._matplotlib_imported:
-            self.skipTest("Matplotlib not installed")
 
-        path = get_file_path(base_folder, "test_mpl_pi")
-        result = forecast_plot.plot_forecast(
-            df_forecast_pi,
-            "png",
-            path,
+@functools.cache
+def _df_forecast_facet():
+    """Multi-source data for faceted plots."""
+    df = _df_forecast()
+    df_facet = pd.concat([df] * len(_sources), ignore_index=True)
+    df_facet["source"] = pd.Categorical(np.repeat(_sources, len(df)), categories=_sources)
+    return df_facet
+
+
+@functools.cache
+def _df_forecast_pi():
+    """Data with prediction intervals (single source)."""
+    return _as_categories(_load_cached(samples_folder / "df_test_forecast.csv"))
+
+
+@functools.cache
+def _df_forecast_pi_facet():
+    """Data with prediction intervals and multiple sources."""
+    return _as_categories(_load_cached(samples_folder / "df_test_forecast_mds.csv"))
+
+
+# Source labels including nulls, as (labels, dtype). Rows with a null label
+# get no facet.
+_NULL_SOURCES = {
+    "str": (["ts1", "ts2", None], "str"),
+    "object": (["ts1", "ts2", None], object),
+    "float": ([1.0, 2.0, np.nan], float),
+}
+
+
+def _df_null_source(kind):
+    """Multi-source data where one source label is null."""
+    labels, dtype = _NULL_SOURCES[kind]
+    df = _df_forecast()
+    df_facet = pd.concat([df] * len(labels), ignore_index=True)
+    df_facet["source"] = pd.Series(np.repeat(np.array(labels, dtype=object), len(df)), dtype=dtype)
+    return df_facet
+
+
+# Failure-path tests return before plotting, so any valid frame will do
+_TINY_DF = pd.DataFrame({
+    "date": [pd.Timestamp("2020-01-01")],
+    "model": ["x"],
+    "y": [0.0],
+    "is_actuals": [True],
+})
+
+
+# Plot test cases: (name, fixture, plot_forecast arguments)
+_PNG_CASES = [
+    (
+        "single",
+        _df_forecast,
+        dict(width=900, height=600, title="Single Series Forecast", show_legend=False),
+    ),
+    (
+        "facet",
+        _df_forecast_facet,
+        dict(width=1200, height=900, title="Multi-Source Forecast", show_legend=True),
+    ),
+    (
+        "pi",
+        _df_forecast_pi,
+        dict(
             width=900,
             height=600,
             title="Forecast with Prediction Intervals",
             show_legend=True,
             include_interval=True,
-        )
-        self.assertEqual(result, 0)
-        self.assertTrue(os.path.isfile(f"{path}.png"))
-
-    def test_plot_facet_with_intervals_png(self):
-        """Test PNG output with faceted layout and prediction intervals."""
-        if not forecast_plot._matplotlib_imported:
-            self.skipTest("Matplotlib not installed")
-
-        path = get_file_path(base_folder, "test_mpl_pi_facet")
-        result = forecast_plot.plot_forecast(
-            df_forecast_pi_facet,
-            "png",
-            path,
+        ),
+    ),
+    (
+        "pi_facet",
+        _df_forecast_pi_facet,
+        dict(
             width=1200,
             height=900,
             title="Multi-Source Forecast with Intervals",
             show_legend=True,
             include_interval=True,
-        )
-        self.assertEqual(result, 0)
-        self.assertTrue(os.path.isfile(f"{path}.png"))
-
-    def test_plot_png_missing_path(self):
-        """Test PNG generation with missing path fails gracefully."""
-        if not forecast_plot._matplotlib_imported:
-            self.skipTest("Matplotlib not installed")
-
-        result = forecast_plot.plot_forecast(
-            df_forecast_pi,
-            "png",
-            path=None,
-            title="Test",
-        )
-        self.assertEqual(result, 1)
-
-
-class TestForecastPlotHTML(PandasTest):
-    """Test plotly HTML plot generation."""
-
-    def test_plot_single_series_html(self):
-        """Test HTML output for single time series."""
-        if not forecast_plot._plotly_imported:
-            self.skipTest("Plotly not installed")
-
-        path = get_file_path(base_folder, "test_plotly_single")
-        result = forecast_plot.plot_forecast(
-            df_forecast,
-            "html",
-            path,
+        ),
+    ),
+]
+
+_HTML_CASES = [
+    (
+        "single",
+        _df_forecast,
+        dict(width=1000, height=600, title="Single Series Forecast", show_legend=False),
+    ),
+    (
+        "legend",
+        _df_forecast,
+        dict(width=1000, height=600, title="Forecast with Legend", show_legend=True),
+    ),
+    (
+        "svg",
+        _df_forecast,
+        dict(
             width=1000,
             height=600,
-            title="Single Series Forecast",
+            title="Single Series Forecast (SVG)",
             show_legend=False,
-        )
-        self.assertEqual(result, 0)
-        self.assertTrue(os.path.isfile(f"{path}.html"))
-
-    def test_plot_single_series_html_with_legend(self):
-        """Test HTML output with legend enabled."""
-        if not forecast_plot._plotly_imported:
-            self.skipTest("Plotly not installed")
-
-        path = get_file_path(base_folder, "test_plotly_legend")
-        result = forecast_plot.plot_forecast(
-            df_forecast,
-            "html",
-            path,
-            width=1000,
-            height=600,
-            title="Forecast with Legend",
-            show_legend=True,
-        )
-        self.assertEqual(result, 0)
-        self.assertTrue(os.path.isfile(f"{path}.html"))
-
-    def test_plot_facet_html(self):
-        """Test HTML output with faceted layout."""
-        if not forecast_plot._plotly_imported:
-            self.skipTest("Plotly not installed")
-
-        path = get_file_path(base_folder, "test_plotly_facet")
-        result = forecast_plot.plot_forecast(
-            df_forecast_facet,
-            "html",
-            path,
-            width=1200,
-            height=900,
-            title="Multi-Source Forecast",
-            show_legend=False,
-        )
-        self.assertEqual(result, 0)
-        self.assertTrue(os.path.isfile(f"{path}.html"))
-
-    def test_plot_with_intervals_html(self):
-        """Test HTML output with prediction intervals."""
-        if not forecast_plot._plotly_imported:
-            self.skipTest("Plotly not installed")
-
-        path = get_file_path(base_folder, "test_plotly_pi")
-        result = forecast_plot.plot_forecast(
-            df_forecast_pi,
-            "html",
-            path,
+            use_gl=False,
+        ),
+    ),
+    (
+        "facet",
+        _df_forecast_facet,
+        dict(width=1200, height=900, title="Multi-Source Forecast", show_legend=False),
+    ),
+    (
+        "pi",
+        _df_forecast_pi,
+        dict(
             width=1000,
             height=600,
             title="Forecast with Prediction Intervals",
             show_legend=False,
             include_interval=True,
-        )
-        self.assertEqual(result, 0)
-        self.assertTrue(os.path.isfile(f"{path}.html"))
-
-    def test_plot_facet_with_intervals_html(self):
-        """Test HTML output with faceted layout and prediction intervals."""
-        if not forecast_plot._plotly_imported:
-            self.skipTest("Plotly not installed")
-
-        path = get_file_path(base_folder, "test_plotly_pi_facet")
-        result = forecast_plot.plot_forecast(
-            df_forecast_pi_facet,
-            "html",
-            path,
+        ),
+    ),
+    (
+        "pi_facet",
+        _df_forecast_pi_facet,
+        dict(
             width=1200,
             height=900,
             title="Multi-Source Forecast with Intervals",
             show_legend=False,
             include_interval=True,
-        )
-        self.assertEqual(result, 0)
-        self.assertTrue(os.path.isfile(f"{path}.html"))
+        ),
+    ),
+]
 
-    def test_plot_html_missing_path(self):
-        """Test HTML generation with missing path fails gracefully."""
-        if not forecast_plot._plotly_imported:
-            self.skipTest("Plotly not installed")
 
+@pytest.mark.parametrize(
+    "name, get_df, kwargs", _PNG_CASES, ids=[case[0] for case in _PNG_CASES]
+)
+def test_plot_png(name, get_df, kwargs, shared_figure, plot_folder):
+    """Test PNG output for single and faceted series, with and without intervals."""
+    path = str(plot_folder / f"test_mpl_{name}")
+    result = forecast_plot.plot_forecast_png(
+        get_df(),
+        path,
+        pil_kwargs=_PNG_PIL_KWARGS,
+        fig=shared_figure,
+        **kwargs,
+    )
+    assert result == 0
+    assert os.stat(f"{path}.png").st_size > 0
+
+
+def test_plot_facet_parallel_png(shared_figure, plot_folder):
+    """Test PNG output with facets rendered in worker processes."""
+    if forecast_plot._get_joblib() is None:
+        pytest.skip("joblib not installed")
+
+    path = str(plot_folder / "test_mpl_facet_parallel")
+    result = forecast_plot.plot_forecast_png(
+        _df_forecast_pi_facet(),
+        path,
+        width=1200,
+        height=900,
+        title="Multi-Source Forecast (parallel)",
+        show_legend=True,
+        include_interval=True,
+        n_jobs=2,
+        pil_kwargs=_PNG_PIL_KWARGS,
+        fig=shared_figure,
+    )
+    assert result == 0
+    assert os.stat(f"{path}.png").st_size > 0
+
+
+@pytest.mark.parametrize("kind", list(_NULL_SOURCES))
+def test_plot_null_source_png(kind, shared_figure, plot_folder):
+    """Test PNG output when a source label is null."""
+    path = str(plot_folder / f"test_mpl_null_{kind}")
+    result = forecast_plot.plot_forecast_png(
+        _df_null_source(kind), path, pil_kwargs=_PNG_PIL_KWARGS, fig=shared_figure
+    )
+    assert result == 0
+    assert os.stat(f"{path}.png").st_size > 0
+
+
+def test_prepare_plot_data_unused_categories():
+    """Test a categorical source filtered to one label gives a single plot."""
+    df = _df_forecast_facet()
+    df_one = df.loc[df["source"] == "ts1"]
+    assert len(df_one["source"].cat.categories) == len(_sources)
+
+    _, subplots, sources, nrows, ncols = forecast_plot._prepare_plot_data(df_one, None)
+    assert not subplots
+    assert list(sources) == ["y"]
+    assert (nrows, ncols) == (1, 1)
+
+    _, subplots, sources, _, _ = forecast_plot._prepare_plot_data(df, None)
+    assert subplots
+    assert list(sources) == _sources
+
+
+@pytest.mark.parametrize("kind", list(_NULL_SOURCES))
+def test_prepare_plot_data_null_source(kind):
+    """Test null source labels get no facet, whatever the column dtype."""
+    df = _df_null_source(kind)
+    _, subplots, sources, nrows, ncols = forecast_plot._prepare_plot_data(df, None)
+    assert subplots
+    assert len(sources) == 2
+    assert not pd.isna(sources).any()
+    assert (nrows, ncols) == (2, 1)
+
+
+def test_plot_png_missing_path(matplotlib_warm):
+    """Test PNG generation with missing path fails gracefully."""
+    result = forecast_plot.plot_forecast(
+        _TINY_DF,
+        "png",
+        path=None,
+        title="Test",
+    )
+    assert result == 1
+
+
+@pytest.mark.parametrize(
+    "name, get_df, kwargs", _HTML_CASES, ids=[case[0] for case in _HTML_CASES]
+)
+def test_plot_html(name, get_df, kwargs, plotly_warm, plot_folder):
+    """Test HTML output for single and faceted series, with and without intervals."""
+    path = str(plot_folder / f"test_plotly_{name}")
+    result = forecast_plot.plot_forecast_html(get_df(), path, include_plotlyjs=False, **kwargs)
+    assert result == 0
+    assert os.stat(f"{path}.html").st_size > 0
+
+
+@pytest.mark.parametrize("kind", list(_NULL_SOURCES))
+def test_plot_null_source_html(kind, plotly_warm, plot_folder):
+    """Test HTML output when a source label is null."""
+    path = str(plot_folder / f"test_plotly_null_{kind}")
+    result = forecast_plot.plot_forecast_html(_df_null_source(kind), path, include_plotlyjs=False)
+    assert result == 0
+    assert os.stat(f"{path}.html").st_size > 0
+
+
+def test_plotly_template(plotly_warm):
+    """Test the forecast template only adds to plotly's default template."""
+    default = plotly_warm.io.templates[plotly_warm.io.templates.default]
+    template = forecast_plot._get_plotly_template()
+    assert template.layout.plot_bgcolor == "#fafafa"
+    assert template.layout.xaxis.tickformat == "%Y-%m-%d"
+    # Settings the forecast styles do not cover are inherited
+    assert template.layout.title.x == default.layout.title.x
+    assert template.layout.colorway == default.layout.colorway
+    assert template.data == default.data
+    # The registered default template is left unchanged
+    assert default.layout.plot_bgcolor != "#fafafa"
+
+
+def test_plot_html_missing_path(plotly_warm):
+    """Test HTML generation with missing path fails gracefully."""
+    result = forecast_plot.plot_forecast(
+        _TINY_DF,
+        "html",
+        path=None,
+        title="Test",
+    )
+    assert result == 1
+
+
+def test_plot_html_invalid_format(plotly_warm, plot_folder):
+    """Test invalid output format returns error."""
+    path = str(plot_folder / "test_invalid")
+    result = forecast_plot.plot_forecast(
+        _TINY_DF,
+        output="invalid_format",
+        path=path,
+    )
+    assert result == 1
+
+
+def test_load_cached_read_only(tmp_path, monkeypatch):
+    """Test a fixture cache that cannot be written still returns the data."""
+    csv_path = tmp_path / "df_test_forecast.csv"
+    csv_path.write_bytes((samples_folder / "df_test_forecast.csv").read_bytes())
+
+    def fail_to_pickle(self, path, *args, **kwargs):
+        raise PermissionError(f"read-only: {path}")
+
+    monkeypatch.setattr(pd.DataFrame, "to_pickle", fail_to_pickle)
+    df = _load_cached(csv_path)
+    assert len(df) > 0
+    assert not os.path.exists(f"{csv_path}.pkl")
+
+
+@pytest.mark.parametrize("compiled", [False, True], ids=["python", "compiled"])
+def test_lttb(compiled):
+    """Test LTTB keeps endpoints and the requested number of points."""
+    # The compiled function is numba's njit of _lttb, or _lttb without numba
+    lttb = forecast_plot._get_lttb() if compiled else forecast_plot._lttb
+    x = np.arange(1000.0)
+    y = np.sin(x / 50.0)
+    y[500] = 10.0
+    idx = lttb(x, y, 100)
+    assert len(idx) == 100
+    assert idx[0] == 0
+    assert idx[-1] == 999
+    assert np.all(np.diff(idx) > 0)
+    # Spikes survive the reduction
+    assert 500 in idx
+
+    # Short series are returned unchanged
+    np.testing.assert_array_equal(lttb(x[:50], y[:50], 100), np.arange(50))
+
+
+def test_downsample_actuals(plot_folder):
+    """Test only long actuals series are reduced."""
+    n = 1000
+    df_long = pd.concat(
+        [
+            pd.DataFrame({
+                "date": pd.date_range("2018-01-01", periods=n, freq="h"),
+                "model": "actuals",
+                "y": np.sin(np.arange(n) / 50.0),
+                "is_actuals": True,
+            }),
+            pd.DataFrame({
+                "date": pd.date_range("2018-02-12", periods=200, freq="h"),
+                "model": "forecast",
+                "y": 1.0,
+                "is_actuals": False,
+            }),
+        ],
+        ignore_index=True,
+    )
+    df_facet = pd.concat(
+        [df_long.assign(source="long"), _df_forecast().assign(source="short")],
+        ignore_index=True,
+    )
+
+    df_result = forecast_plot._downsample_actuals(df_facet, 100)
+    df_count = df_result.groupby(["source", "is_actuals"]).size()
+    assert df_count.loc[("long", True)] == 100
+    assert df_count.loc[("long", False)] == 200
+    assert df_count.loc[("short", True)] == 6
+    assert df_count.loc[("short", False)] == 10
+
+    # Nothing to reduce returns the input frame
+    assert forecast_plot._downsample_actuals(df_facet, 2000) is df_facet
+
+    # Timezone-aware dates keep the same points
+    df_facet_utc = df_facet.assign(date=df_facet["date"].dt.tz_localize("UTC"))
+    df_result_utc = forecast_plot._downsample_actuals(df_facet_utc, 100)
+    pd.testing.assert_index_equal(df_result_utc.index, df_result.index)
+    assert forecast_plot._downsample_actuals(df_facet_utc, 2000) is df_facet_utc
+
+    if forecast_plot._get_matplotlib() is not None:
+        path = str(plot_folder / "test_mpl_downsample_utc")
         result = forecast_plot.plot_forecast(
-            df_forecast_pi,
-            "html",
-            path=None,
-            title="Test",
+            df_facet_utc, "png", path, max_points_per_trace=100, pil_kwargs=_PNG_PIL_KWARGS
         )
-        self.assertEqual(result, 1)
-
-    def test_plot_html_invalid_format(self):
-        """Test invalid output format returns error."""
-        if not forecast_plot._plotly_imported:
-            self.skipTest("Plotly not installed")
+        assert result == 0
+        assert os.stat(f"{path}.png").st_size > 0
 
-        path = get_file_path(base_folder, "test_invalid")
+    if forecast_plot._get_plotly() is not None:
+        path = str(plot_folder / "test_plotly_downsample")
         result = forecast_plot.plot_forecast(
-            df_forecast_pi,
-            output="invalid_format",
-            path=path,
+            df_facet,
+            "html",
+            path,
+            title="Downsampled",
+            max_points_per_trace=100,
+            include_plotlyjs=False,
         )
-        self.assertEqual(result, 1)
-
-
-class TestForecastPlotJupyter(PandasTest):
-    """Test Jupyter notebook plot generation."""
-
-    def test_plot_jupyter_output(self):
-        """Test Jupyter output (validation is limited without notebook)."""
-        if not (forecast_plot._plotly_imported and forecast_plot._ipython_imported):
-            self.skipTest("Plotly or IPython not installed")
+        assert result == 0
+        assert os.stat(f"{path}.html").st_size > 0
 
-        # Jupyter output returns iplot result, not error code
+        path = str(plot_folder / "test_plotly_downsample_utc")
         result = forecast_plot.plot_forecast(
-            df_forecast_pi_facet,
-            output="jupyter",
-            width=1200,
-            height=800,
-            title="Jupyter Forecast",
-            show_legend=False,
+            df_facet_utc,
+            "html",
+            path,
+            max_points_per_trace=100,
+            include_plotlyjs=False,
         )
-        # Result is iplot object, not int
-        self.assertIsNotNone(result)
-
+        assert result == 0
+        assert os.stat(f"{path}.html").st_size > 0
+
+
+def test_plot_jupyter_output(plotly_warm):
+    """Test Jupyter output (validation is limited without notebook)."""
+    if not forecast_plot._ipython_imported:
+        pytest.skip("IPython not installed")
+
+    # Jupyter output returns iplot result, not error code
+    result = forecast_plot.plot_forecast(
+        _df_forecast_pi_facet(),
+        output="jupyter",
+        width=1200,
+        height=800,
+        title="Jupyter Forecast",
+        show_legend=False,
+    )
+    # Result is iplot object, not int
+    assert result is not None